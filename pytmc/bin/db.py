@@ -9,7 +9,7 @@ import logging
 import os
 import pathlib
 import sys
-from collections import defaultdict
+from collections import Counter, defaultdict
 from typing import Optional
 
 from .. import linter, parser
@@ -126,26 +126,22 @@ def process(
             logger.error("   [db:%d] %s", line_num, line)
         return context
 
-    records = [
-        record
-        for symbol in find_pytmc_symbols(tmc, allow_no_pragma=allow_no_pragma)
+    # Sort record packages and exceptions in the same pass that creates them
+    records: list[RecordPackage] = []
+    exceptions = []
+    for symbol in find_pytmc_symbols(tmc, allow_no_pragma=allow_no_pragma):
         for record in record_packages_from_symbol(
             symbol, yield_exceptions=not debug, allow_no_pragma=allow_no_pragma
-        )
-    ]
-
-    exceptions = [ex for ex in records if isinstance(ex, Exception)]
-
-    for ex in exceptions:
-        logger.error("Error creating record: %s", ex)
-        records.remove(ex)
+        ):
+            if isinstance(record, Exception):
+                logger.error("Error creating record: %s", record)
+                exceptions.append(record)
+            else:
+                records.append(record)
 
     if exceptions and not allow_errors:
         raise LinterError("Failed to create database")
 
-    # We removed exceptions from the record list above:
-    records: list[RecordPackage]
-
     def by_tcname(record: RecordPackage):
         return record.tcname
 
@@ -158,11 +154,10 @@ def process(
         for single_record in record_package.records
     ]
 
-    if len(record_names) != len(set(record_names)):
+    record_name_counts = Counter(record_names)
+    if len(record_names) != len(record_name_counts):
         dupes = {
-            name: record_names.count(name)
-            for name in record_names
-            if record_names.count(name) > 1
+            name: count for name, count in record_name_counts.items() if count > 1
         }
         message = "\n".join(
             ["Duplicate records encountered:"]
@@ -365,8 +360,12 @@ def main(
         )
         sys.exit(1)
 
-    db_string = "\n\n".join(record.render() for record in records)
-    record_file.write(db_string)
+    # Write records as they are rendered, rather than building the full
+    # database in memory first
+    for idx, record in enumerate(records):
+        if idx > 0:
+            record_file.write("\n\n")
+        record_file.write(record.render())
 
     if archive_file:
         archive_file.write("\n".join(generate_archive_settings(records)))
@@ -4,6 +4,7 @@ given TwinCAT project or source code file
 """
 
 import argparse
+import bisect
 import logging
 import pathlib
 import re
@@ -181,19 +182,27 @@ def lint_pragma(pragma):
     return match
 
 
-def _build_map_of_offset_to_line_number(source):
+def _get_line_start_offsets(source):
     """
-    For a multiline source file, return {character_pos: line}
+    For a multiline source file, return the character offset of each line
+
+    Use with ``_line_number_from_offset`` to map offsets to line numbers.
     """
+    line_starts = []
     start_index = 0
-    index_to_line_number = {}
-    # A slow and bad algorithm, but only to be used in parsing declarations
-    # which are rather small
-    for line_number, line in enumerate(source.splitlines(), 1):
-        for index in range(start_index, start_index + len(line) + 1):
-            index_to_line_number[index] = line_number
+    for line in source.splitlines():
+        line_starts.append(start_index)
         start_index += len(line) + 1
-    return index_to_line_number
+    return line_starts
+
+
+def _line_number_from_offset(line_starts, offset):
+    """
+    The 1-based line number containing character ``offset``, or None
+    """
+    if not line_starts:
+        return None
+    return bisect.bisect_right(line_starts, offset)
 
 
 def lint_source(filename, source, verbose=False):
@@ -218,7 +227,7 @@ def lint_source(filename, source, verbose=False):
         if not (decl.text or "").strip():
             continue
 
-        offset_to_line_number = _build_map_of_offset_to_line_number(decl.text)
+        line_starts = _get_line_start_offsets(decl.text)
 
         parent = decl.parent
         path_to_source = []
@@ -245,7 +254,7 @@ def lint_source(filename, source, verbose=False):
                 pragma=pragma,
                 filename=filename,
                 tag=source.tag,
-                line_number=offset_to_line_number.get(offset),
+                line_number=_line_number_from_offset(line_starts, offset),
                 exception=None,
             )
 
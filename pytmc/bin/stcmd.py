@@ -20,6 +20,33 @@ DESCRIPTION = __doc__
 logger = logging.getLogger(__name__)
 
 
+class _MemoryBytecodeCache(jinja2.BytecodeCache):
+    """
+    Keep compiled templates in memory for the lifetime of the process
+
+    Each call to ``main`` needs a fresh environment for its filters, but the
+    compiled template code can be shared.  Entries are keyed on the template
+    filename, and jinja discards them if the template source changes.
+    """
+
+    def __init__(self):
+        self._bytecode = {}
+
+    def load_bytecode(self, bucket):
+        bytecode = self._bytecode.get(bucket.key)
+        if bytecode is not None:
+            bucket.bytecode_from_string(bytecode)
+
+    def dump_bytecode(self, bucket):
+        self._bytecode[bucket.key] = bucket.bytecode_to_string()
+
+    def clear(self):
+        self._bytecode.clear()
+
+
+_bytecode_cache = _MemoryBytecodeCache()
+
+
 def build_arg_parser(parser=None):
     if parser is None:
         parser = argparse.ArgumentParser()
@@ -203,7 +230,14 @@ def main(
     debug=False,
     allow_errors=False,
     hashbang="../../bin/rhel7-x86_64/adsIoc",
+    project=None,
 ):
+    """
+    Output an st.cmd file for the given project.
+
+    Returns the template arguments used to render it, including the
+    ``motors`` that were configured and the ``nc`` instance, if any.
+    """
     jinja_loader = jinja2.ChoiceLoader(
         [
             jinja2.PackageLoader("pytmc", "templates"),
@@ -214,6 +248,7 @@ def main(
         loader=jinja_loader,
         trim_blocks=True,
         lstrip_blocks=True,
+        bytecode_cache=_bytecode_cache,
     )
 
     if not name:
@@ -226,7 +261,8 @@ def main(
 
     template = jinja_env.get_template(template_filename)
 
-    project = parse(tsproj_project)
+    if project is None:
+        project = parse(tsproj_project)
 
     additional_db_files = []
     try:
@@ -325,3 +361,5 @@ def main(
             )
 
         util.python_debug_session(namespace=locals(), message="\n".join(message))
+
+    return template_args
@@ -343,10 +343,10 @@ def get_plc_by_name(
     plc : parser.Plc or None
         The PLC instance.
     """
-    for _, project in projects.items():
-        for plc in project.plcs:
-            if plc.name == plc_name:
-                return project, plc
+    for project in projects.values():
+        plc = project.plcs_by_name.get(plc_name)
+        if plc is not None:
+            return project, plc
 
     return None, None
 
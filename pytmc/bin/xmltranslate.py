@@ -17,7 +17,8 @@ any xml formatted file.
 
 import argparse
 import textwrap
-import xml.etree.ElementTree as ET
+
+import lxml.etree
 
 DESCRIPTION = __doc__
 
@@ -55,21 +56,22 @@ def recursive(branch, level=1, indent_size=4, indent=0):
         return
     if level == 0:
         return
+    prefix = " " * (indent_size * indent)
     for limb in branch:
-        # for i in range(indent):
-        #    print("    ",end="")
         print(
             textwrap.indent(
                 " ".join(
                     [str(limb.attrib), str(limb.tag), str(limb.text), str(limb.tail)]
                 ),
-                "".join([" "] * indent_size * indent),
+                prefix,
             )
         )
         recursive(limb, level - 1, indent_size, indent + 1)
 
 
 def main(input_file, *, indent_size=4, depth=7):
-    tree = ET.parse(input_file)
+    # Comments and processing instructions are not part of the data model
+    parser = lxml.etree.XMLParser(remove_comments=True, remove_pis=True)
+    tree = lxml.etree.parse(input_file, parser)
     root = tree.getroot()
     recursive(root, depth, indent_size)
@@ -2,6 +2,7 @@
 Code parsing-related utilities
 """
 import collections
+import functools
 import logging
 import re
 
@@ -12,6 +13,9 @@ RE_FUNCTION_BLOCK = re.compile(r"^FUNCTION_BLOCK\s", re.MULTILINE)
 RE_PROGRAM = re.compile(r"^PROGRAM\s", re.MULTILINE)
 RE_FUNCTION = re.compile(r"^FUNCTION\s", re.MULTILINE)
 RE_ACTION = re.compile(r"^ACTION\s", re.MULTILINE)
+# Match two groups: (var) := (value)
+# Only works for simple variable assignments.
+RE_ARG_VALUE = re.compile(r"([a-zA-Z0-9_]+)\s*:=\s*([a-zA-Z0-9_\.]+)")
 
 
 def program_name_from_declaration(declaration):
@@ -149,6 +153,18 @@ def variables_from_declaration(declaration, *, start_marker="var"):
     return variables
 
 
+@functools.lru_cache(maxsize=4096)
+def _get_call_block_regex(var):
+    """
+    Compiled regular expression to find call blocks of ``var``
+
+    Compiled once per variable name; projects readily have more names than
+    the ``re`` module's own pattern cache holds.
+    """
+    # Find: ^VAR(.*);
+    return re.compile(r"^\s*" + var + r"\s*\(\s*((?:.*?\n?)+)\)\s*;", re.MULTILINE)
+
+
 def get_pou_call_blocks(declaration: str, implementation: str):
     """
     Find all call blocks given a specific POU declaration and implementation.
@@ -191,15 +207,9 @@ def get_pou_call_blocks(declaration: str, implementation: str):
     variables = variables_from_declaration(declaration)
     blocks = collections.defaultdict(dict)
 
-    # Match two groups: (var) := (value)
-    # Only works for simple variable assignments.
-    arg_value_re = re.compile(r"([a-zA-Z0-9_]+)\s*:=\s*([a-zA-Z0-9_\.]+)")
-
     for var in variables:
-        # Find: ^VAR(.*);
-        reg = re.compile(r"^\s*" + var + r"\s*\(\s*((?:.*?\n?)+)\)\s*;", re.MULTILINE)
-        for match in reg.findall(implementation):
+        for match in _get_call_block_regex(var).findall(implementation):
             call_body = " ".join(line.strip() for line in match.splitlines())
-            blocks[var].update(**dict(arg_value_re.findall(call_body)))
+            blocks[var].update(**dict(RE_ARG_VALUE.findall(call_body)))
 
     return dict(blocks)
@@ -1,3 +1,4 @@
+import functools
 import os
 
 import pyPDB.dbd.yacc as _yacc
@@ -89,6 +90,55 @@ class DbdFile:
                 contents = f.read()
 
         self.parsed = _yacc.parse(contents)
+        self._definitions = {}
+
+    def _load_definitions(self, results, options):
+        """
+        Load the dbd record types and device support into linter results
+
+        The dbd is walked only once per set of linter options; afterwards, a
+        copy of the resulting state is loaded into ``results``.
+        """
+        if options not in self._definitions:
+            walked = LinterResults(_get_linter_args(options))
+            _dbdlint.walk(self.parsed, _dbdlint.dbdtree, walked)
+            self._definitions[options] = walked
+
+        walked = self._definitions[options]
+        results.rectypes = {
+            rtyp: dict(fields) for rtyp, fields in walked.rectypes.items()
+        }
+        results.recdsets = {
+            rtyp: dict(dsets) for rtyp, dsets in walked.recdsets.items()
+        }
+        results.recinst = dict(walked.recinst)
+        results.extinst = set(walked.extinst)
+        results.errors = list(walked.errors)
+        results.warnings = list(walked.warnings)
+        results._error = walked._error
+        results._warning = walked._warning
+
+
+@functools.lru_cache(maxsize=None)
+def _get_linter_args(options):
+    """
+    Parse dbdlint command-line options once per unique set of options
+
+    Only the options are relevant to the linter results; input filenames are
+    never read from the parsed arguments.
+    """
+    return _dbdlint.getargs(["<dbd>", "<db>", *options])
+
+
+@functools.lru_cache(maxsize=4)
+def _get_dbd_file(filename, mtime):
+    """
+    Parse a dbd file once per modification time
+
+    Parsing a full IOC dbd is slow; tools such as ``pytmc template`` lint each
+    PLC's database against the same dbd path.
+    """
+    return DbdFile(filename)
 
 
 def lint_db(
@@ -111,8 +161,8 @@ def lint_db(
     ----------
     dbd : DbdFile or str
         The database definition file; filename or pre-loaded DbdFile
-    db : str
-        The database filename or text
+    db : str or file
+        The database filename, text, or file-like object
     full : bool, optional
         Validate as a complete database
     warn_quoted : bool, optional
@@ -161,13 +211,22 @@ def lint_db(
     else:
         args.append("-P")
 
-    dbd_file = dbd if isinstance(dbd, DbdFile) else DbdFile(dbd)
-
-    args = _dbdlint.getargs([dbd_file.filename, db, *args])
+    if isinstance(dbd, DbdFile):
+        dbd_file = dbd
+    elif hasattr(dbd, "read"):
+        dbd_file = DbdFile(dbd)
+    else:
+        dbd_file = _get_dbd_file(str(dbd), os.path.getmtime(dbd))
 
-    results = LinterResults(args)
+    options = tuple(args)
+    results = LinterResults(_get_linter_args(options))
 
-    if os.path.exists(db):
+    if hasattr(db, "read"):
+        db_content = db.read()
+        db = getattr(db, "name", "<string>")
+    # Rendered database text is multi-line; only single-line values can be
+    # filenames, so avoid hitting the filesystem for in-memory databases
+    elif "\n" not in db and os.path.exists(db):
         with open(db) as f:
             db_content = f.read()
     else:
@@ -175,7 +234,7 @@ def lint_db(
         db = "<string>"
 
     try:
-        _dbdlint.walk(dbd_file.parsed, _dbdlint.dbdtree, results)
+        dbd_file._load_definitions(results, options)
         parsed_db = _yacc.parse(db_content, file=db)
         _dbdlint.walk(parsed_db, _dbdlint.dbdtree, results)
     except DBSyntaxError as ex:
@@ -100,7 +100,7 @@ def element_to_class_name(
     """
 
     tag = strip_namespace(element.tag)
-    extension = os.path.splitext(element.base)[-1].lower()
+    extension = get_base_extension(element.base)
 
     # `Project` is an overloaded tag in TwinCAT XML files. It can be:
     # * A `TcSmProject`
@@ -207,9 +207,18 @@ class TwincatItem:
         name : str, optional
         filename : pathlib.Path, optional
         """
-        self.child_load_path = _determine_path(
-            filename.parent if filename else pathlib.Path(), name, self._load_path_hint
-        )
+        if (
+            parent is not None
+            and parent.filename is filename
+            and not parent._load_path_hint
+        ):
+            # The parent's load path is already the directory of this file;
+            # reuse it rather than computing it again for every element
+            base_path = parent.child_load_path
+        else:
+            base_path = filename.parent if filename else pathlib.Path()
+
+        self.child_load_path = _determine_path(base_path, name, self._load_path_hint)
 
         self.attributes = dict(element.attrib)
         self._children = []
@@ -283,13 +292,24 @@ class TwincatItem:
         ----------
         cls : TwincatItem
         """
-        for child in self._children:
-            if isinstance(child, cls):
-                yield child
-                if not recurse:
-                    continue
-
-            yield from child.find(cls, recurse=recurse)
+        # Walk the tree with an explicit stack: recursing would stack up one
+        # generator per level, with every match passing through all of them.
+        stack = [iter(self._children)]
+        while stack:
+            for child in stack[-1]:
+                if isinstance(child, cls):
+                    yield child
+                    if not recurse:
+                        continue
+
+                if type(child).find is not TwincatItem.find:
+                    # Some items (e.g., Plc) search beyond their own children
+                    yield from child.find(cls, recurse=recurse)
+                elif child._children:
+                    stack.append(iter(child._children))
+                    break
+            else:
+                stack.pop()
 
     def _add_children(self, element):
         "A hook for adding all children"
@@ -298,6 +318,14 @@ class TwincatItem:
                 self.comments.append(child_element.text)
                 continue
             self._add_child(child_element)
+            # The child keeps copies of everything it needs; release the XML
+            # subtree now so the DOM shrinks as the item tree grows.
+            child_element.clear(keep_tail=True)
+
+        if not self._children:
+            # Most items are leaves; skip grouping an empty list of children
+            self.children = types.SimpleNamespace()
+            return
 
         by_tag = separate_by_classname(self._children)
         self.children = types.SimpleNamespace(**by_tag)
@@ -486,7 +514,7 @@ class TcModuleClass(_TwincatProjectSubItem):
         # NOTE: _make_fake_item normally does not truly insert the item into
         # the hierarchy, but pretends that the child has a parent. Here, we
         # actually link both child and parent.
-        module = list(self.find(Module))[module_index]
+        module = list(self.find(Module, recurse=False))[module_index]
         if not hasattr(module, "DataAreas"):
             _make_fake_item("DataAreas", parent=module, add_as_child=True)
 
@@ -605,20 +633,33 @@ class TcSmProject(TwincatItem):
         else:
             self.top_level_plc = self.top_level_project.top_level_plc
 
+    @functools.cached_property
+    def nc_by_task_name(self) -> dict[str, list[NC]]:
+        """
+        The NC configurations keyed by their SAF task name.
+
+        Every NC with a given name is kept, so that callers can tell a
+        duplicated task name apart from a unique one.
+        """
+        by_task_name = collections.defaultdict(list)
+        for nc in self.find(NC, recurse=False):
+            by_task_name[nc.SafTask[0].name].append(nc)
+        return dict(by_task_name)
+
     @property
     def plcs(self) -> Generator[Plc, None, None]:
         "The virtual PLC projects contained in this TcSmProject"
         yield from self.top_level_plc.projects.values()
 
     @property
-    def plcs_by_name(self) -> dict[str, Plc]:
+    def plcs_by_name(self) -> typing.Mapping[str, Plc]:
         "The virtual PLC projects in a dictionary keyed by name"
-        return {plc.name: plc for plc in self.plcs}
+        return types.MappingProxyType(self.top_level_plc.projects)
 
     @property
-    def plcs_by_link_name(self) -> dict[str, Plc]:
+    def plcs_by_link_name(self) -> typing.Mapping[str, Plc]:
         "The virtual PLC projects in a dictionary keyed by link name"
-        return {plc.link_name: plc for plc in self.plcs}
+        return types.MappingProxyType(self.top_level_plc.projects_by_link_name)
 
 
 def get_data_type_by_reference(
@@ -805,8 +846,9 @@ class Plc(TwincatItem):
         self.namespaces.update(self.gvl_by_name)
         self.namespaces.update(self.dut_by_name)
 
-    @property
+    @functools.cached_property
     def links(self) -> list[Link]:
+        "All links of this PLC, gathered once from its mappings"
         mappings = getattr(self, "Mappings", None)
         if mappings is None:
             # This is technically a TwinCAT misconfiguration as far as PCDS is
@@ -825,6 +867,20 @@ class Plc(TwincatItem):
             for link in mapping.find(Link, recurse=False)
         ]
 
+    @functools.cached_property
+    def links_by_variable(self) -> dict[str, list[Link]]:
+        """
+        Links keyed on the lower-case name of their ``VarA`` variable.
+
+        That is, a link from ``PlcTask Inputs^Main.M1.Axis.NcToPlc`` is found
+        under ``main.m1.axis.nctoplc``.
+        """
+        by_variable = collections.defaultdict(list)
+        for link in self.links:
+            variable = link.a[1] or ""
+            by_variable[variable.rsplit("^", 1)[-1].lower()].append(link)
+        return dict(by_variable)
+
     @property
     def port(self):
         """
@@ -936,7 +992,11 @@ class DataTypes(_TmcItem):
     "[TMC or TSPROJ] Container of DataType"
 
     def post_init(self):
-        self.types = {dtype.qualified_type_name: dtype for dtype in self.find(DataType)}
+        # DataType items do not nest; skip searching their SubItems
+        self.types = {
+            dtype.qualified_type_name: dtype
+            for dtype in self.find(DataType, recurse=False)
+        }
 
         # Also allow access by GUID:
         self.types.update(
@@ -1253,7 +1313,9 @@ class DataType(_TmcItem):
 class BoundDataType:
     """Binds a symbol or SubItem with array/pointer/etc information."""
 
-    _extra_attrs = ["data_type", "array_info", "is_pointer", "is_reference"]
+    # One of these is created per data type lookup; keep them small.
+    __slots__ = ("data_type", "array_info", "is_pointer", "is_reference")
+    _extra_attrs = list(__slots__)
 
     def __init__(
         self,
@@ -1333,8 +1395,10 @@ class SubItem(_TmcItem):
     BitSize: list[_TmcItem]
     BitOffs: list[_TmcItem]
 
-    @property
+    @functools.cached_property
     def data_type(self):
+        # SubItems are shared by every instance of their DataType, so resolve
+        # the (immutable) type reference only once
         return get_data_type_by_reference(
             self.Type[0],
             (self.tmc, self.find_ancestor(TcSmProject)),
@@ -1612,12 +1676,8 @@ class Symbol_ST_MotionStage(Symbol):
         plc = self.plc
         if self.plc is None:
             return None
-        expected = "^" + self.name.lower() + ".axis.nctoplc"
-        links = [
-            link
-            for link in plc.links
-            if expected in link.a[1].lower()
-        ]
+        expected = self.name.lower() + ".axis.nctoplc"
+        links = plc.links_by_variable.get(expected, [])
 
         if not links:
             raise RuntimeError(
@@ -1636,11 +1696,8 @@ class Symbol_ST_MotionStage(Symbol):
 
         task_name, axis_section, axis_name = parent_name
 
-        (nc,) = list(
-            nc
-            for nc in self.root.find(NC, recurse=False)
-            if nc.SafTask[0].name == task_name
-        )
+        # Exactly one NC is expected to run the task
+        (nc,) = self.root.nc_by_task_name.get(task_name, [])
         nc_axis = nc.axis_by_name[axis_name]
         # link nc_axis and FB_MotionStage?
         return nc_axis
@@ -2321,18 +2378,19 @@ class _ArrayItemProxy:
         The array index to use
     """
 
+    # One proxy is made per expanded array element; keep them small.
+    __slots__ = ("name", "item", "_index")
+
     def __init__(self, item, index):
-        self.__dict__.update(
-            name=f"{item.name}[{index}]",
-            item=item,
-            _index=index,
-        )
+        object.__setattr__(self, "name", f"{item.name}[{index}]")
+        object.__setattr__(self, "item", item)
+        object.__setattr__(self, "_index", index)
 
     def __getattr__(self, attr):
-        return getattr(self.__dict__["item"], attr)
+        return getattr(self.item, attr)
 
     def __setattr__(self, attr, value):
-        return setattr(self.__dict__["item"], attr, value)
+        return setattr(self.item, attr, value)
 
 
 def _make_fake_item(
@@ -2436,6 +2494,12 @@ def separate_by_classname(children: list[TwincatItem]) -> dict[str, list[Twincat
     return dict(d)
 
 
+@functools.lru_cache(maxsize=256)
+def get_base_extension(base: str) -> str:
+    "Lower-case file extension of an element's base URL, e.g. '.tmc'"
+    return os.path.splitext(base)[-1].lower()
+
+
 @functools.lru_cache(maxsize=2048)
 def strip_namespace(tag: str) -> str:
     "Strip off {{namespace}} from: {{namespace}}tag"
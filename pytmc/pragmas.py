@@ -3,10 +3,13 @@ This file contains the objects for taking in pytmc-parsed TMC files and
 generating Python-level configuration information.
 """
 import copy
+import functools
 import itertools
 import logging
 import math
 import re
+import sys
+import types
 from collections.abc import Generator
 from typing import Union
 
@@ -100,6 +103,8 @@ def split_pytmc_pragma(pragma_text):
         {'f_name': '...', 'f_set': '...'}
         """
         groupdict = match.groupdict()
+        # Titles become configuration keys; share one copy of each
+        groupdict["title"] = sys.intern(groupdict["title"])
         tag = groupdict["tag"]
         groupdict["tag"] = (
             split_field(tag.strip()) if groupdict["title"] == "field" else tag.strip()
@@ -109,6 +114,26 @@ def split_pytmc_pragma(pragma_text):
     return [line_to_dict(m) for m in result_no_delims]
 
 
+@functools.lru_cache(maxsize=1024)
+def _split_pytmc_pragma_cached(pragma_text):
+    """
+    Memoized ``split_pytmc_pragma`` for building chains
+
+    Every chain through a structure re-reads the pragmas of the items it
+    shares with its siblings, so the same text is split many times in a row.
+    The lines (and field tags) are shared between callers, so they are
+    returned as read-only mappings.
+    """
+
+    def freeze(line):
+        tag = line["tag"]
+        if isinstance(tag, dict):
+            tag = types.MappingProxyType(tag)
+        return types.MappingProxyType(dict(line, tag=tag))
+
+    return tuple(freeze(line) for line in split_pytmc_pragma(pragma_text))
+
+
 def split_field(string):
     """
     When applied to field line's tag, break the string into its own dict
@@ -124,7 +149,9 @@ def split_field(string):
         Keys are 'f_name' for the field name and 'f_set' for the corresponding
         setting.
     """
-    return _FIELD_FINDER.search(string).groupdict()
+    groupdict = _FIELD_FINDER.search(string).groupdict()
+    groupdict["f_name"] = sys.intern(groupdict["f_name"])
+    return groupdict
 
 
 def separate_configs_by_pv(config_lines):
@@ -287,7 +314,7 @@ def _expand_configurations_from_chain(
             yield parser._ArrayItemProxy(item, idx), idx_config
 
     def get_all_options(subitems, handler, pragmas):
-        split_pragma = split_pytmc_pragma("\n".join(pragmas))
+        split_pragma = _split_pytmc_pragma_cached("\n".join(pragmas))
         for pvname, separated_cfg in separate_configs_by_pv(split_pragma):
             config = dictify_config(separated_cfg)
 
@@ -681,6 +708,18 @@ class SingularChain:
         The final configuration based on the full chain of configurations
     """
 
+    __slots__ = (
+        "item_to_config",
+        "chain",
+        "last",
+        "data_type",
+        "array_info",
+        "tcname",
+        "valid",
+        "config",
+        "pvname",
+    )
+
     def __init__(self, item_to_config):
         self.item_to_config = item_to_config
         self.chain = list(self.item_to_config)
@@ -689,14 +728,10 @@ class SingularChain:
         self.array_info = self.chain[-1].array_info
         self.tcname = ".".join(part.name for part in self.chain)
 
-        self.valid = True
-
-        for config in item_to_config:
-            # Detect Nones signifying an incomplete pragma
-            if item_to_config[config] is None:
-                self.valid = False
+        # A None signifies an incomplete pragma
+        self.valid = None not in item_to_config.values()
 
-        self.config = squash_configs(*list(item_to_config.values()))
+        self.config = squash_configs(*item_to_config.values())
         self.pvname = ":".join(
             pv_segment for pv_segment in self.config["pv"] if pv_segment
         )
@@ -736,12 +771,11 @@ def get_pragma(
     str
 
     """
-    name_list = [name, f"plcAttribute_{name}"]
     if hasattr(item, "Properties"):
+        names = {name, f"plcAttribute_{name}"}
         properties = item.Properties[0]
         for prop in getattr(properties, "Property", []):
-            # Return true if any of the names searched for are found
-            if any(indiv_name == prop.name for indiv_name in name_list):
+            if prop.name in names:
                 yield prop.value
 
 
@@ -876,7 +910,7 @@ def make_fake_symbol_from_data_type(
         raise ValueError("Unable to find a tmc to insert the symbol")
 
     # TODO: does data area make a difference?
-    data_areas = list(tmc.find(parser.DataArea))
+    data_areas = list(tmc.find(parser.DataArea, recurse=False))
     if not data_areas:
         if not create_data_area_if_needed:
             raise ValueError("No data area found to create symbol")
@@ -2,7 +2,7 @@
 Record generation and templating
 """
 import logging
-from collections import ChainMap, OrderedDict
+from collections import ChainMap
 from typing import Optional
 
 import jinja2
@@ -21,10 +21,13 @@ MAX_ARCHIVE_ELEMENTS = 999
 # This field length maximum is based on the .DESC field length in epics-base:
 MAX_DESC_FIELD_LENGTH = 40
 
+# Templates are package data and do not change at runtime; skip the
+# up-to-date check (a filesystem stat) on every EPICSRecord instantiation:
 _default_jinja_env = jinja2.Environment(
     loader=jinja2.PackageLoader("pytmc", "templates"),
     trim_blocks=True,
     lstrip_blocks=True,
+    auto_reload=False,
 )
 
 
@@ -80,6 +83,20 @@ def _update_description(record, default):
 class EPICSRecord:
     """Representation of a single EPICS Record"""
 
+    __slots__ = (
+        "pvname",
+        "record_type",
+        "direction",
+        "fields",
+        "aliases",
+        "template",
+        "autosave",
+        "package",
+        "archive_settings",
+        "long_description",
+        "record_template",
+    )
+
     def __init__(
         self,
         pvname,
@@ -95,12 +112,13 @@ class EPICSRecord:
         self.pvname = pvname
         self.record_type = record_type
         self.direction = direction
-        self.fields = OrderedDict(fields) if fields is not None else {}
+        self.fields = dict(fields) if fields is not None else {}
         self.aliases = list(aliases) if aliases is not None else []
         self.template = template or "asyn_standard_record.jinja2"
         self.autosave = dict(autosave) if autosave else {}
         self.package = package
         self.archive_settings = dict(archive_settings) if archive_settings else {}
+        self.long_description = None
 
         if "fields" not in self.archive_settings:
             self.archive_settings = {}
@@ -267,11 +285,11 @@ class RecordPackage:
         """
         if self.pvname is None or not self.chain.valid:
             return False
-        has_required_keys = all(self.config.get(key) for key in self._required_keys)
+        if not all(self.config.get(key) for key in self._required_keys):
+            return False
 
         fields = self.config.get("field", {})
-        has_required_fields = all(fields.get(key) for key in self._required_fields)
-        return has_required_keys and has_required_fields
+        return all(fields.get(key) for key in self._required_fields)
 
     @property
     def records(self):
@@ -894,6 +912,32 @@ class WaveformRecordPackage(TwincatTypeRecordPackage):
             "SIMS",  # Simulation Mode Severity
         ],
     )
+    # Field type of value, by TwinCAT data type name
+    ftvl_by_data_type = {
+        "BOOL": "CHAR",
+        "INT": "SHORT",
+        "ENUM": "SHORT",
+        "DINT": "LONG",
+        "REAL": "FLOAT",
+        "LREAL": "DOUBLE",
+    }
+    # Device type, by TwinCAT data type name.
+    # Assumes ArrayIn/ArrayOut will be appended
+    dtyp_by_data_type = {
+        "BOOL": "asynInt8",
+        "BYTE": "asynInt8",
+        "SINT": "asynInt8",
+        "USINT": "asynInt8",
+        "WORD": "asynInt16",
+        "INT": "asynInt16",
+        "UINT": "asynInt16",
+        "DWORD": "asynInt32",
+        "DINT": "asynInt32",
+        "UDINT": "asynInt32",
+        "ENUM": "asynInt16",  # -> Int32?
+        "REAL": "asynFloat32",
+        "LREAL": "asynFloat64",
+    }
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
@@ -903,15 +947,7 @@ class WaveformRecordPackage(TwincatTypeRecordPackage):
     @property
     def ftvl(self):
         """Field type of value"""
-        ftvl = {
-            "BOOL": "CHAR",
-            "INT": "SHORT",
-            "ENUM": "SHORT",
-            "DINT": "LONG",
-            "REAL": "FLOAT",
-            "LREAL": "DOUBLE",
-        }
-        return ftvl[self.chain.data_type.name]
+        return self.ftvl_by_data_type[self.chain.data_type.name]
 
     @property
     def nelm(self):
@@ -931,25 +967,7 @@ class WaveformRecordPackage(TwincatTypeRecordPackage):
         does not have any associated device support, DTYP and DSET are
         meaningless."
         """
-
-        # Assumes ArrayIn/ArrayOut will be appended
-        data_types = {
-            "BOOL": "asynInt8",
-            "BYTE": "asynInt8",
-            "SINT": "asynInt8",
-            "USINT": "asynInt8",
-            "WORD": "asynInt16",
-            "INT": "asynInt16",
-            "UINT": "asynInt16",
-            "DWORD": "asynInt32",
-            "DINT": "asynInt32",
-            "UDINT": "asynInt32",
-            "ENUM": "asynInt16",  # -> Int32?
-            "REAL": "asynFloat32",
-            "LREAL": "asynFloat64",
-        }
-
-        return data_types[self.chain.data_type.name]
+        return self.dtyp_by_data_type[self.chain.data_type.name]
 
     def generate_input_record(self):
         record = super().generate_input_record()
@@ -1072,19 +1090,19 @@ DATA_TYPES = {
 
 
 def sort_fields(
-    unsorted: OrderedDict,
+    unsorted: dict,
     sort_lookup: Optional[dict] = None,
     last: Optional[bool] = True,
-) -> OrderedDict:
+) -> dict:
     """
-    Sort the ordered dict according to the sort_scheme given at instantiation.
+    Sort the field dict according to the sort_scheme given at instantiation.
     Does NOT sort in place.
 
     Parameters
     ----------
 
     unsorted
-        An OrderedDict in need of sorting.
+        A dictionary of fields in need of sorting.
 
     sort_lookup
         Requires a Dictionary, reverse lookup table for identifying sorting
@@ -1100,31 +1118,18 @@ def sort_fields(
     if sort_lookup is None:
         sort_lookup = unified_lookup_list
 
-    instructed_unsorted = OrderedDict()
-    naive_unsorted = OrderedDict()
+    # Entries identified by the sort scheme are ordered by their index in it,
+    # the rest alphabetically; a single pass places the two groups per 'last'
+    instructed_group, naive_group = (0, 1) if last else (1, 0)
 
-    # Separate items identified by the sort_sceme into instructed_unsorted
-    for x in unsorted:
-        if x in sort_lookup:
-            instructed_unsorted[x] = unsorted[x]
-        else:
-            naive_unsorted[x] = unsorted[x]
+    def sort_key(item):
+        key = item[0]
+        index = sort_lookup.get(key)
+        if index is None:
+            return (naive_group, 0, key)
+        return (instructed_group, index, "")
 
-    # Separately sort instructed and, naively sorted entries
-    instructed_sorted = sorted(
-        instructed_unsorted.items(), key=lambda key: sort_lookup[key[0]]
-    )
-    naive_sorted = sorted(naive_unsorted.items())
-
-    # Merge both Odicts in the order given by 'last'
-    combined_sorted = OrderedDict()
-    if last:
-        combined_sorted.update(instructed_sorted)
-        combined_sorted.update(naive_sorted)
-    else:
-        combined_sorted.update(naive_sorted)
-        combined_sorted.update(instructed_sorted)
-    return combined_sorted
+    return dict(sorted(unsorted.items(), key=sort_key))
 
 
 def generate_archive_settings(packages):
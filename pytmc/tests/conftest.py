@@ -1,26 +1,113 @@
+import functools
 import logging
+import os
 import pathlib
 
 import pytest
 
-import pytmc
 from pytmc import linter, parser
+from pytmc.bin.db import process as db_process
 
 logger = logging.getLogger(__name__)
 TEST_PATH = pathlib.Path(__file__).parent
 DBD_FILE = TEST_PATH / "ads.dbd"
 
 TMC_ROOT = TEST_PATH / "tmc_files"
-TMC_FILES = list(TMC_ROOT.glob("*.tmc"))
-INVALID_TMC_FILES = list((TMC_ROOT / "invalid").glob("*.tmc"))
+# Sorted, so that every pytest-xdist worker collects the same parameters
+TMC_FILES = sorted(TMC_ROOT.glob("*.tmc"))
+# Rendering or linting the full database of these takes the longest
+SLOW_TMC_FILES = {"tc_mot_example.tmc"}
 PROJ_ROOT = TEST_PATH / "projects"
-TSPROJ_PROJECTS = list(str(fn) for fn in TEST_PATH.glob("**/*.tsproj"))
+TSPROJ_PROJECTS = sorted(str(fn) for fn in TEST_PATH.glob("**/*.tsproj"))
 TEMPLATES = TEST_PATH / "templates"
 
 
-@pytest.fixture(scope="module")
+@functools.lru_cache(maxsize=None)
+def get_parsed_tmc(tmc_filename):
+    """
+    Parse a .tmc file, once per test session
+
+    The parsed item is shared between tests, which must not modify it.
+    """
+    return parser.parse(tmc_filename)
+
+
+@functools.lru_cache(maxsize=None)
+def get_parsed_project(project_filename):
+    """
+    Parse a .tsproj project, once per test session
+
+    Projects are parsed at collection time to find their PLCs; the same
+    parsed project is then reused by the tests.  Tests must not modify it.
+    """
+    return parser.parse(project_filename)
+
+
+@functools.lru_cache(maxsize=None)
+def get_db_text(tmc_filename):
+    """
+    Render the full database for a .tmc file, once per test session
+    """
+    tmc = get_parsed_tmc(tmc_filename)
+    records, _ = db_process(tmc, allow_errors=True)
+    return "\n\n".join(record.render() for record in records)
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--run-slow",
+        action="store_true",
+        default=False,
+        help="Also run tests marked as slow, which are skipped by default",
+    )
+
+
+def pytest_configure(config):
+    config.addinivalue_line(
+        "markers", "slow: slow test, only run when --run-slow is given"
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    if config.getoption("--run-slow"):
+        return
+
+    skip_slow = pytest.mark.skip(reason="slow; use --run-slow to run")
+    for item in items:
+        if "slow" in item.keywords:
+            item.add_marker(skip_slow)
+
+
+@pytest.fixture(scope="session")
 def dbd_file():
-    return pytmc.linter.DbdFile(DBD_FILE)
+    # Shares lint_db's own cache, so that linting by filename does not parse
+    # the dbd a second time
+    return linter._get_dbd_file(str(DBD_FILE), os.path.getmtime(DBD_FILE))
+
+
+@pytest.fixture(scope="session")
+def db_output_path(tmp_path_factory):
+    """
+    Directory for generated database files, shared by the whole session
+    """
+    return tmp_path_factory.mktemp("db")
+
+
+def tmc_file_params():
+    """
+    TMC_FILES as pytest params, with the larger files marked ``slow``
+
+    For tests which process the whole database of each file, parametrize
+    ``tmc_filename`` with these in place of the default fixture.
+    """
+    return [
+        pytest.param(
+            fn,
+            id=fn.name,
+            marks=[pytest.mark.slow] if fn.name in SLOW_TMC_FILES else [],
+        )
+        for fn in TMC_FILES
+    ]
 
 
 @pytest.fixture(params=TMC_FILES, ids=[f.name for f in TMC_FILES])
@@ -36,6 +123,14 @@ def tmc_xtes_sxr_plc():
     return TMC_ROOT / "xtes_sxr_plc.tmc"
 
 
+@pytest.fixture(scope="module")
+def tmc_mot_example():
+    """
+    Parsed .tmc file with both ST_MotionStage and DUT_MotionStage motors
+    """
+    return get_parsed_tmc(TMC_ROOT / "tc_mot_example.tmc")
+
+
 @pytest.fixture(scope="module")
 def tmc_arbiter_plc():
     """
@@ -53,14 +148,14 @@ def tmc_pmps_dev_arbiter():
     return path
 
 
-@pytest.fixture(params=TSPROJ_PROJECTS)
+@pytest.fixture(scope="module", params=TSPROJ_PROJECTS)
 def project_filename(request):
     return request.param
 
 
 def _generate_project_and_plcs():
     for project_filename in TSPROJ_PROJECTS:
-        project = parser.parse(project_filename)
+        project = get_parsed_project(project_filename)
         for plc_name in project.plcs_by_name:
             yield project_filename, plc_name
 
@@ -79,9 +174,9 @@ def project_and_plc(request):
     return Item
 
 
-@pytest.fixture(scope="function")
+@pytest.fixture(scope="module")
 def project(project_filename):
-    return parser.parse(project_filename)
+    return get_parsed_project(project_filename)
 
 
 def lint_record(dbd_file, record):
@@ -90,11 +185,23 @@ def lint_record(dbd_file, record):
     assert not len(linted.errors)
 
 
+@functools.lru_cache(maxsize=None)
+def find_in_project(project, cls):
+    """
+    Find all instances of cls in a session-cached project (or one of its
+    items, such as a PLC), walking it only once
+
+    Projects from ``get_parsed_project`` live for the whole session and are
+    not modified by the tests, so the results remain valid throughout.
+    """
+    return tuple(project.find(cls))
+
+
 def get_real_motor_symbols(project):
     """
     Motor symbols minus arrays of motors
     """
     return [
-        motor for motor in project.find(parser.Symbol_ST_MotionStage)
+        motor for motor in find_in_project(project, parser.Symbol_ST_MotionStage)
         if not hasattr(motor, 'ArrayInfo')
     ]
@@ -1,6 +1,5 @@
 import pytest
 
-import pytmc
 import pytmc.pragmas
 import pytmc.record
 
@@ -96,6 +95,5 @@ def get_record_package(data_type, io, pragma):
 )
 def test_archive(data_type, io, pragma, expected):
     record_package = get_record_package(data_type, io, pragma)
-    print(record_package)
     archive_settings = list(pytmc.record.generate_archive_settings([record_package]))
     assert archive_settings == expected
@@ -15,7 +15,7 @@ from pytmc.bin.template import main as template_main
 from pytmc.bin.types import create_types_gui
 from pytmc.bin.xmltranslate import main as xmltranslate_main
 
-from .conftest import TEMPLATES
+from .conftest import TEMPLATES, get_parsed_project, get_parsed_tmc, tmc_file_params
 
 
 def test_help_main(monkeypatch):
@@ -55,20 +55,32 @@ def test_pragmalint(project_filename, project_filename_linter_success):
     pragmalint_main(project_filename, verbose=True, use_markdown=True)
 
 
-def test_stcmd(project_and_plc):
+def test_stcmd(project_and_plc, db_output_path):
     project_filename = project_and_plc.project
     plc_name = project_and_plc.plc_name
     allow_errors = any(
         name in project_filename
         for name in ("lcls-twincat-motion", "XtesSxrPlc", "plc-kfe-gmd-vac")
     )
-    stcmd_main(project_filename, plc_name=plc_name, allow_errors=allow_errors)
+    stcmd_main(
+        project_filename,
+        plc_name=plc_name,
+        allow_errors=allow_errors,
+        db_path=db_output_path,
+        project=get_parsed_project(project_filename),
+    )
 
 
 def test_xmltranslate(project_filename):
     xmltranslate_main(project_filename)
 
 
+def test_xmltranslate_tmc(tmc_filename, capsys):
+    xmltranslate_main(tmc_filename, depth=2)
+    assert "DataTypes" in capsys.readouterr().out
+
+
+@pytest.mark.parametrize("tmc_filename", tmc_file_params())
 def test_db(tmc_filename):
     db_main(tmc_filename, archive_file=sys.stderr)
 
@@ -78,16 +90,25 @@ def test_db_archive_bad_args(tmc_filename):
     db_main(tmc_filename, archive_file=sys.stderr, no_archive_file=True)
 
 
+@pytest.mark.parametrize("tmc_filename", tmc_file_params())
 def test_types(qtbot, tmc_filename):
-    widget = create_types_gui(tmc_filename)
+    widget = create_types_gui(get_parsed_tmc(tmc_filename))
     qtbot.addWidget(widget)
 
 
+@pytest.mark.parametrize("tmc_filename", tmc_file_params())
 def test_debug(qtbot, tmc_filename):
-    widget = create_debug_gui(tmc_filename)
+    widget = create_debug_gui(get_parsed_tmc(tmc_filename))
     qtbot.addWidget(widget)
 
 
+def test_gui_from_filename(qtbot, tmc_xtes_sxr_plc):
+    # The tests above share parsed tmcs; make sure filenames still work
+    for create_gui in (create_types_gui, create_debug_gui):
+        for tmc in (str(tmc_xtes_sxr_plc), tmc_xtes_sxr_plc):
+            qtbot.addWidget(create_gui(tmc))
+
+
 def test_code(project_filename):
     code_main(project_filename)
 
@@ -99,7 +120,6 @@ def test_template_basic(project_filename):
         templates=[template + os.pathsep],
     )
 
-    print("templated", templated)
     assert templated[template] == project_filename
 
 
@@ -115,7 +135,7 @@ def test_template_smoke(project_filename, template):
         templates=[template + os.pathsep],
     )
 
-    print("templated", templated)
+    assert template in templated
 
 
 @pytest.mark.parametrize(
@@ -164,7 +184,6 @@ def test_filename_split(
     def exists(fn: str) -> bool:
         if fn in {"-", ""}:
             return False
-        print("Exists?", fn, fn in {input_filename, output_filename})
         return fn in {input_filename, output_filename}
 
     monkeypatch.setattr(os.path, "exists", exists)
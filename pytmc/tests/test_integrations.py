@@ -5,10 +5,9 @@ test files.
 
 import pytest
 
-from pytmc import parser
 from pytmc.bin.db import process as db_process
 
-from .conftest import PROJ_ROOT, TMC_ROOT
+from .conftest import PROJ_ROOT, TMC_ROOT, get_parsed_tmc
 
 
 @pytest.mark.parametrize(
@@ -29,7 +28,7 @@ def test_global_pinned_variables(tmc_file_name, target_pv):
     created to contain the 'plcAttribute_pytmc' style <Name> fields in place of
     the normal 'pytmc'.
     """
-    tmc = parser.parse(tmc_file_name)
+    tmc = get_parsed_tmc(tmc_file_name)
 
     records, exceptions = db_process(
         tmc, dbd_file=None, allow_errors=False, show_error_context=True
@@ -46,7 +45,7 @@ def test_allow_no_pragma():
     """
     tmc_file_name = TMC_ROOT / ("xtes_sxr_plc.tmc")
 
-    tmc = parser.parse(tmc_file_name)
+    tmc = get_parsed_tmc(tmc_file_name)
 
     records, exceptions = db_process(
         tmc,
@@ -67,13 +66,11 @@ def test_allow_no_pragma():
     total_records = 1005
 
     assert good_records == len(records)
-    assert good_records == len(list(x.valid for x in records if x.valid))
+    assert all(x.valid for x in records)
     assert total_records == len(all_records)
-    assert good_records == len(list(x.valid for x in all_records if x.valid))
+    assert good_records == sum(1 for x in all_records if x.valid)
 
     # this variable lacks a pragma
     target_variable = "GVL_DEVICES.MR2K3_GCC_1.rV"
-    for x in all_records:
-        print(x.tcname)
-    assert any((target_variable == x.tcname) for x in all_records)
+    assert target_variable in {x.tcname for x in all_records}
     assert exceptions == []
@@ -105,8 +105,13 @@ def make_source_param(pragma, variable="VAR", type="INT", **param_kw):
     ],
 )
 def test_lint_pragma(source):
-    print("Linting source:")
-    print(source._source)
     for info in lint_source("filename", source, verbose=True):
         if info.exception:
             raise info.exception
+
+
+def test_lint_pragma_line_number():
+    source = make_source("pv: test", "VAR", "INT")
+    (info,) = lint_source("filename", source)
+    # The source starts with a blank line, followed by the pragma
+    assert info.line_number == 2
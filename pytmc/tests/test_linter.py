@@ -0,0 +1,84 @@
+import io
+import logging
+
+import pytest
+
+from pytmc import linter
+
+from . import conftest
+
+
+@pytest.mark.parametrize("tmc_filename", conftest.tmc_file_params())
+def test_db_linting(tmc_filename, dbd_file):
+    db_text = conftest.get_db_text(tmc_filename)
+    results = linter.lint_db(dbd=dbd_file, db=db_text)
+    assert not results.errors
+
+
+def test_lint_errors_collected(dbd_file):
+    db_text = 'record(ai, "Tst:pv") {\n    field(NOT_A_FIELD, "1")\n}\n'
+    results = linter.lint_db(dbd=dbd_file, db=db_text)
+    assert not results.success
+    (error,) = results.errors
+    assert error["name"] == "bad-field"
+    assert error["format_args"] == ("ai", "NOT_A_FIELD")
+
+
+class _TupleHandler(logging.Handler):
+    "Keep only the dbdlint location, level and message of each record"
+
+    def __init__(self):
+        super().__init__()
+        self.rows = []
+
+    def emit(self, record):
+        self.rows.append(
+            (
+                getattr(record, "dbfile", None),
+                getattr(record, "dbline", None),
+                record.levelname,
+                record.getMessage(),
+            )
+        )
+
+
+def test_lint_errors_logged(dbd_file):
+    db_text = 'record(ai, "Tst:pv") {\n    field(NOT_A_FIELD, "1")\n}\n'
+    handler = _TupleHandler()
+    dbdlint_logger = logging.getLogger("dbdlint")
+    dbdlint_logger.addHandler(handler)
+    try:
+        linter.lint_db(dbd=dbd_file, db=db_text)
+    finally:
+        dbdlint_logger.removeHandler(handler)
+
+    # Results are collected, but pyPDB's own message logger still fires
+    ((_, dbline, level, message),) = handler.rows
+    assert (dbline, level) == (2, "ERROR")
+    assert "NOT_A_FIELD" in message
+
+
+def test_dbd_definitions_reused(dbd_file):
+    bad_db = 'record(ai, "Tst:bad") {\n    field(NOT_A_FIELD, "1")\n}\n'
+    good_db = 'record(ai, "Tst:good") {\n    field(DESC, "1")\n}\n'
+    assert not linter.lint_db(dbd=dbd_file, db=bad_db).success
+    # Neither errors nor record instances carry over between lint runs
+    results = linter.lint_db(dbd=dbd_file, db=good_db)
+    assert results.success
+    assert set(results.recinst) == {"Tst:good"}
+
+
+def test_lint_file_object(dbd_file):
+    db = io.StringIO('record(ai, "Tst:pv") {\n    field(NOT_A_FIELD, "1")\n}\n')
+    db.name = "test.db"
+    results = linter.lint_db(dbd=dbd_file, db=db)
+    (error,) = results.errors
+    assert error["file"] == "test.db"
+
+
+def test_dbd_filename_parsed_once():
+    db_text = 'record(ai, "Tst:pv") {\n    field(DESC, "1")\n}\n'
+    assert linter.lint_db(dbd=str(conftest.DBD_FILE), db=db_text).success
+    misses = linter._get_dbd_file.cache_info().misses
+    assert linter.lint_db(dbd=conftest.DBD_FILE, db=db_text).success
+    assert linter._get_dbd_file.cache_info().misses == misses
@@ -1,4 +1,7 @@
-from pathlib import Path
+import contextlib
+import io
+
+import pytest
 
 from pytmc import parser
 from pytmc.bin import stcmd
@@ -7,73 +10,64 @@ from pytmc.pragmas import get_pragma
 from .conftest import get_real_motor_symbols
 
 
-def test_motion_stcmd(capsys, project_filename):
+def test_motion_stcmd(project_filename, project):
     """
     Sanity check of motor setup in the st.cmd files
 
     For all plc projects:
         1. Is a controller created only when needed?
         2. Are the right number of axes created?
-
-    Note: capsys is a built-in pytest fixture for capturing stdout and stderr
     """
     controller_func = "EthercatMCCreateController"
     motor_func = "EthercatMCCreateAxis"
 
-    full_project = parser.parse(project_filename)
-
-    for plc_name, plc_project in full_project.plcs_by_name.items():
+    for plc_name, plc_project in project.plcs_by_name.items():
         motors = get_real_motor_symbols(plc_project)
-        # Clear captured buffer just in case
-        capsys.readouterr()
-        stcmd.main(
-            project_filename, plc_name=plc_name, only_motor=True, allow_errors=True
-        )
-        output = capsys.readouterr().out
-
-        if motors:
-            assert controller_func in output
-        else:
-            assert controller_func not in output
-
+        buf = io.StringIO()
+        with contextlib.redirect_stdout(buf):
+            info = stcmd.main(
+                project_filename,
+                plc_name=plc_name,
+                only_motor=True,
+                allow_errors=True,
+                project=project,
+            )
+
+        assert len(info["motors"]) == len(motors)
+        assert info["nc"] is not None or not motors
+
+        output = buf.getvalue()
+        assert (controller_func in output) == bool(motors)
+        # One axis is rendered per configured motor
         assert output.count(motor_func) == len(motors)
 
 
-def test_axis_name_without_pragma():
+@pytest.mark.parametrize(
+    "pragma, expected",
+    [
+        pytest.param(None, ("PREFIX:", "Axis:1"), id="nc-axis-name"),
+        pytest.param("pv: MY:STAGE", ("MY:", "STAGE"), id="pragma"),
+    ],
+)
+def test_axis_name(pragma, expected):
     from .test_xml_collector import make_mock_twincatitem, make_mock_type
 
     axis = make_mock_twincatitem(
         name="Main.my_axis",
         data_type=make_mock_type("ST_MotionStage", is_complex_type=True),
-        # pragma='pv: OUTER',
+        pragma=pragma,
     )
 
+    # The NC axis name is only used in the absence of a pragma
     class NCAxis:
         name = "Axis 1"
 
     axis.nc_axis = NCAxis
     user_config = dict(delim=":", prefix="PREFIX")
-    prefix, name = stcmd.get_name(axis, user_config=user_config)
-    assert name == NCAxis.name.replace(" ", user_config["delim"])
-    assert prefix == user_config["prefix"] + user_config["delim"]
-
-
-def test_axis_name_with_pragma():
-    from .test_xml_collector import make_mock_twincatitem, make_mock_type
-
-    axis = make_mock_twincatitem(
-        name="Main.my_axis",
-        data_type=make_mock_type("ST_MotionStage", is_complex_type=True),
-        pragma="pv: MY:STAGE",
-    )
-
-    # axis.nc_axis is unimportant here as we have the pragma
-    user_config = dict(delim=":", prefix="PREFIX")
-    prefix, name = stcmd.get_name(axis, user_config=user_config)
-    assert (prefix, name) == ("MY:", "STAGE")
+    assert stcmd.get_name(axis, user_config=user_config) == expected
 
 
-def test_mixed_motionstage_naming():
+def test_mixed_motionstage_naming(tmc_mot_example):
     """
     Check an example tmc file with 9 ST_MotionStage and 1 DUT_MotionStage
 
@@ -81,22 +75,18 @@ def test_mixed_motionstage_naming():
     If only 9: we only recognize ST_MotionStage
     If only 1: we only recognize DUT_MotionStage
     """
-    file = Path(__file__).parent / 'tmc_files' / 'tc_mot_example.tmc'
-    tmc_item = parser.parse(file)
-    motors = tmc_item.find(parser.Symbol_ST_MotionStage)
+    motors = tmc_mot_example.find(parser.Symbol_ST_MotionStage)
     assert len(list(motors)) == 10
 
 
-def test_macro_in_motor_stcmd():
+def test_macro_in_motor_stcmd(tmc_mot_example):
     """
     Make sure the @ -> $ substitutions happen in stcmd.
 
     The example TMC has some @(PREFIX) substitutions on motors as well as some
     motors with no @ substitutions.
     """
-    file = Path(__file__).parent / 'tmc_files' / 'tc_mot_example.tmc'
-    tmc_item = parser.parse(file)
-    all_motors = list(tmc_item.find(parser.Symbol_ST_MotionStage))
+    all_motors = list(tmc_mot_example.find(parser.Symbol_ST_MotionStage))
     yes_sub = [
         motor for motor in all_motors if "@" in next(get_pragma(motor))
     ]
@@ -1,7 +1,8 @@
-from pathlib import Path
+import types
 
 import pytest
 
+from pytmc import parser
 from pytmc.parser import get_pou_call_blocks, parse, variables_from_declaration
 
 from .conftest import TEST_PATH
@@ -234,19 +235,72 @@ def test_route_parsing():
     }
 
 
-def test_type_alias_parsing():
+def test_type_alias_parsing(tmc_mot_example):
     """
     Type aliases should resolve to the same walk as their source
     """
-    file = Path(__file__).parent / 'tmc_files' / 'tc_mot_example.tmc'
-    tmc_item = parse(file)
-    dut_mot = None
-    st_mot = None
-    for dtyp in tmc_item.DataTypes[0].DataType:
-        if dtyp.name == 'DUT_MotionStage':
-            dut_mot = dtyp
-        elif dtyp.name == 'ST_MotionStage':
-            st_mot = dtyp
+    types = tmc_mot_example.DataTypes[0].types
+    dut_mot = types.get("lcls_twincat_motion.DUT_MotionStage")
+    st_mot = types.get("lcls_twincat_motion.ST_MotionStage")
     assert dut_mot is not None, "Did not find DUT_MotionStage in test setup"
     assert st_mot is not None, "Did not find ST_MotionStage in test setup"
     assert list(dut_mot.walk()) == list(st_mot.walk())
+
+
+@pytest.mark.parametrize("recurse", [True, False])
+def test_find_order(tmc_mot_example, recurse):
+    """
+    find() should match a plain depth-first, pre-order search of the tree
+    """
+
+    def find(item, cls):
+        for child in item._children:
+            if isinstance(child, cls):
+                yield child
+                if not recurse:
+                    continue
+            yield from find(child, cls)
+
+    for cls in (parser.SubItem, parser.DataType, parser.Symbol):
+        expected = list(find(tmc_mot_example, cls))
+        assert expected
+        assert list(tmc_mot_example.find(cls, recurse=recurse)) == expected
+
+
+def test_nc_by_task_name(tmp_path):
+    tsproj = tmp_path / "nc.tsproj"
+    tsproj.write_text(
+        """\
+<TcSmProject>
+  <Project>
+    <Motion>
+      <NC><SafTask Name="NC-Task 1 SAF"/><Axis Id="1" Name="M1"/></NC>
+      <NC><SafTask Name="NC-Task 2 SAF"/></NC>
+      <NC><SafTask Name="NC-Task 2 SAF"/></NC>
+    </Motion>
+  </Project>
+</TcSmProject>
+"""
+    )
+    project = parse(tsproj)
+    ncs = list(project.find(parser.NC))
+    # Duplicated task names keep every NC, rather than just the last one
+    assert project.nc_by_task_name == {
+        "NC-Task 1 SAF": ncs[:1],
+        "NC-Task 2 SAF": ncs[1:],
+    }
+
+    def get_nc_axis(task_name):
+        # nc_axis only needs the link's owner name and the project root
+        owner = types.SimpleNamespace(name=f"TINC^{task_name}^Axes^M1")
+        symbol = types.SimpleNamespace(
+            nc_to_plc_link=types.SimpleNamespace(parent=owner),
+            root=project,
+        )
+        return parser.Symbol_ST_MotionStage.nc_axis.fget(symbol)
+
+    assert get_nc_axis("NC-Task 1 SAF") is ncs[0].axis_by_name["M1"]
+    # Ambiguous or missing tasks are errors, not a silent pick
+    for task_name in ("NC-Task 2 SAF", "NC-Task 3 SAF"):
+        with pytest.raises(ValueError):
+            get_nc_axis(task_name)
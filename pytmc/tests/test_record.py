@@ -1,4 +1,4 @@
-from collections import OrderedDict
+import pytest
 
 from pytmc.linter import lint_db
 from pytmc.record import EPICSRecord, sort_fields
@@ -14,7 +14,6 @@ def test_epics_record_render():
 
     ec = EPICSRecord(**kwargs)
     record = ec.render()
-    print(record)  # For debug purposes
     assert kwargs["pvname"] in record
     assert kwargs["record_type"] in record
     for key, value in kwargs["fields"].items():
@@ -35,32 +34,36 @@ def test_epics_record_with_linter(dbd_file):
     assert not (linted.errors)
 
 
-def test_input_record_without_write_access():
-    kwargs = {
-        "pvname": "Tst:pv",
-        "record_type": "ai",
-        "direction": "input",
-    }
-
-    ec = EPICSRecord(**kwargs)
+@pytest.mark.parametrize(
+    "record_type, direction, write_protected",
+    [
+        pytest.param("ai", "input", True, id="input"),
+        pytest.param("ao", "output", False, id="output"),
+    ],
+)
+def test_record_write_access(record_type, direction, write_protected):
+    ec = EPICSRecord(pvname="Tst:pv", record_type=record_type, direction=direction)
     record = ec.render()
-    assert "ASG" in record
-    assert "NO_WRITE" in record
+    assert ("ASG" in record) == write_protected
+    assert ("NO_WRITE" in record) == write_protected
 
 
-def test_output_record_with_write_access():
-    kwargs = {
-        "pvname": "Tst:pv",
-        "record_type": "ao",
-        "direction": "output",
-    }
-    ec = EPICSRecord(**kwargs)
-    record = ec.render()
-    assert "ASG" not in record
+def test_archive_fields_render_sorted():
+    ec = EPICSRecord(
+        pvname="Tst:pv",
+        record_type="ai",
+        direction="input",
+        archive_settings={
+            "method": "monitor",
+            "seconds": 2,
+            "fields": {"VAL", "STAT", "SEVR"},
+        },
+    )
+    assert 'info(archive, "monitor 2: SEVR STAT VAL")' in ec.render()
 
 
 def test_sort_fields():
-    unsorted_entry = OrderedDict(
+    unsorted_entry = dict(
         [
             ("CALC", None),
             ("very_fake", None),
@@ -72,17 +75,28 @@ def test_sort_fields():
             ("ONSV", None),
         ]
     )
-    correct_entry = OrderedDict(
-        [
-            ("NAME", None),
-            ("ONVL", None),
-            ("FTVL", None),
-            ("ONSV", None),
-            ("SVSV", None),
-            ("CALC", None),
-            ("not_real", None),
-            ("very_fake", None),
-        ]
-    )
+    correct_entry = [
+        ("NAME", None),
+        ("ONVL", None),
+        ("FTVL", None),
+        ("ONSV", None),
+        ("SVSV", None),
+        ("CALC", None),
+        ("not_real", None),
+        ("very_fake", None),
+    ]
     output = sort_fields(unsorted_entry)
-    assert output == correct_entry
+    assert list(output.items()) == correct_entry
+
+
+def test_sort_fields_first():
+    unsorted_entry = dict(
+        [("very_fake", 1), ("FTVL", 2), ("NAME", 3), ("not_real", 4)]
+    )
+    output = sort_fields(unsorted_entry, last=False)
+    assert list(output.items()) == [
+        ("not_real", 4),
+        ("very_fake", 1),
+        ("NAME", 3),
+        ("FTVL", 2),
+    ]
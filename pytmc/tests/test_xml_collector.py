@@ -1,9 +1,9 @@
-import logging
+import copy
 import types
 
 import pytest
 
-from pytmc import parser, pragmas
+from pytmc import pragmas
 from pytmc.record import (MAX_ARCHIVE_ELEMENTS, BinaryRecordPackage,
                           EnumRecordPackage, FloatRecordPackage,
                           IntegerRecordPackage, RecordPackage,
@@ -11,8 +11,6 @@ from pytmc.record import (MAX_ARCHIVE_ELEMENTS, BinaryRecordPackage,
 
 from . import conftest
 
-logger = logging.getLogger(__name__)
-
 
 def make_mock_twincatitem(
     name, data_type, *, pragma=None, array_info=None, ads_port=851
@@ -85,12 +83,24 @@ def make_mock_type(
 
 
 @pytest.fixture(scope="module")
-def chain():
-    tmc = parser.parse(conftest.TMC_ROOT / "xtes_sxr_plc.tmc")
+def _module_chain():
+    tmc = conftest.get_parsed_tmc(conftest.TMC_ROOT / "xtes_sxr_plc.tmc")
     symbols = list(pragmas.find_pytmc_symbols(tmc))
     return list(pragmas.chains_from_symbol(symbols[1]))[0]
 
 
+@pytest.fixture
+def chain(_module_chain):
+    """
+    A copy of the module-level chain, which tests may modify freely
+
+    Chain items are shared; only the chain and its configuration are copied.
+    """
+    chain = copy.copy(_module_chain)
+    chain.config = copy.deepcopy(_module_chain.config)
+    return chain
+
+
 @pytest.mark.parametrize(
     "tc_type, is_array, final_type",
     [
@@ -372,14 +382,6 @@ def test_BaseRecordPackage_guess_PREC(chain, tc_type, sing_index, final_PREC, re
     "tc_type, io, is_str, is_arr, final_FTVL",
     [
         ("INT", "o", False, False, None),
-        pytest.param(
-            "INT",
-            "o",
-            False,
-            True,
-            "FINISH",
-            marks=pytest.mark.skip(reason="feature pending"),
-        ),
         ("BOOL", "i", False, False, None),
         ("BOOL", "i", False, True, "CHAR"),
         ("BOOL", "o", False, True, "CHAR"),
@@ -443,6 +445,24 @@ def test_BaseRecordPackage_guess_NELM(
         assert rec.fields.get("NELM") == final_NELM
 
 
+@pytest.mark.parametrize(
+    "configs, valid",
+    [
+        pytest.param([{"pv": "A"}, {"pv": "B"}], True, id="complete"),
+        pytest.param([None, {"pv": "B"}], False, id="first_missing"),
+        pytest.param([{"pv": "A"}, None], False, id="last_missing"),
+    ],
+)
+def test_singular_chain_valid(configs, valid):
+    items = [
+        make_mock_twincatitem(name=name, data_type=make_mock_type("INT"))
+        for name in ("a", "b")
+    ]
+    chain = pragmas.SingularChain(dict(zip(items, configs)))
+    assert chain.valid == valid
+    assert chain.tcname == "a.b"
+
+
 def test_scalar():
     item = make_mock_twincatitem(
         name="Main.tcname", data_type=make_mock_type("DINT"), pragma="pv: PVNAME"
@@ -600,7 +620,6 @@ def test_enum_array():
         "ENUMS:04",
     }
 
-    print(records)
     enum01 = records["ENUMS:01"]
     assert isinstance(enum01, EnumRecordPackage)
     assert enum01.field_defaults["ZRVL"] == 1
@@ -628,7 +647,6 @@ def test_string_array():
         "STRINGS:05",
     }
 
-    print(records)
     string02 = records["STRINGS:02"]
     assert isinstance(string02, StringRecordPackage)
     assert string02.field_defaults["FTVL"] == "CHAR"
@@ -774,10 +792,6 @@ def test_waveform_archive(chain, dbd_file, elements, archive_settings):
     assert record.archive_settings == archive_settings
     assert len(record.records) == 2
     for rec in record.records:
-        print()
-        print("Archive settings", record.archive_settings)
-        print(rec.render())
-
         assert rec.fields.get("APST") == "On Change"
         assert rec.fields.get("MPST") == "On Change"
 
@@ -1,11 +1,8 @@
-import logging
-
 import pytest
 
+from pytmc import pragmas
 from pytmc.pragmas import separate_configs_by_pv, split_pytmc_pragma
 
-logger = logging.getLogger(__name__)
-
 
 @pytest.fixture()
 def leaf_bool_pragma_string():
@@ -134,6 +131,18 @@ def test_config_lines(
     assert split_pytmc_pragma(string) == test
 
 
+def test_split_pragma_cached(leaf_bool_pragma_string):
+    cached = pragmas._split_pytmc_pragma_cached(leaf_bool_pragma_string)
+    assert list(cached) == split_pytmc_pragma(leaf_bool_pragma_string)
+    assert pragmas._split_pytmc_pragma_cached(leaf_bool_pragma_string) is cached
+
+    # Shared between callers, so neither lines nor field tags may be modified
+    with pytest.raises(TypeError):
+        cached[0]["tag"] = "OTHER:PV"
+    with pytest.raises(TypeError):
+        cached[2]["tag"]["f_set"] = "OTHER"
+
+
 def test_neaten_field(leaf_bool_pragma_string):
     config_lines = split_pytmc_pragma(leaf_bool_pragma_string)
     assert config_lines[2]["tag"] == {"f_name": "ZNAM", "f_set": "SINGLE"}